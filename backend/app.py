@@ -1,22 +1,98 @@
+import asyncio
+import hashlib
+import string
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from typing import Dict, List, Tuple, Optional
 
-from fastapi import FastAPI, Depends, HTTPException, Query, Body
+import orjson
+from fastapi import FastAPI, Depends, HTTPException, Query, Body, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from botocore.exceptions import ClientError
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from botocore.exceptions import BotoCoreError, ClientError
 
 from auth import verify_token
+from cache import cache_get, cache_put, consistency_cache, invalidate, list_cache
 from config import DEFAULT_BUCKET, PRESIGN_TTL, S3_ZONES, PRESIGN_UPLOAD_TTL
 from s3_utils import (
     get_s3_client,
+    get_async_s3_client,
+    close_async_s3_clients,
     find_zone_url,
     latest_entry_for_key,
     entry_to_brief,
     find_best_version,
-    format_datetime_iso,
+    presign_v4_url,
 )
 
+# Entries requested per zone when looking up the newest version of a key.
+LATEST_LOOKUP_MAX_KEYS = 2
+# Keys requested per ListObjectsV2 call (the S3 maximum).
+LIST_PAGE_SIZE = 1000
+# Split points for parallel listing of large folders (?parallel=true), and its worker count.
+LIST_SPLIT_BOUNDARIES = string.digits + string.ascii_uppercase + string.ascii_lowercase
+LIST_PARALLEL_WORKERS = 16
+# S3 DeleteObjects accepts at most this many keys per call; chunks run with this many workers.
+DELETE_OBJECTS_CHUNK = 1000
+BULK_DELETE_WORKERS = 8
+# Upper bound on in-flight S3 calls for one /consistency/check request.
+ZONE_FANOUT_CONCURRENCY = 16
+# Upper bound on in-flight S3 calls made by a single batch request.
+BATCH_MAX_CONCURRENCY = 32
+# Upper bound on keys accepted by one batch request (the UI sends chunks of 100).
+BATCH_MAX_KEYS = 100
+
+# Lets browsers reuse a polled body briefly before revalidating via If-None-Match.
+ETAG_CACHE_CONTROL = "private, max-age=5"
+
+
+def _body_etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def _etag_response(request: Request, body: bytes, etag: Optional[str] = None) -> Response:
+    """
+    Return `body` as JSON with an ETag, or an empty 304 when the client's
+    If-None-Match already names that ETag.
+    """
+    etag = etag or _body_etag(body)
+    headers = {"ETag": etag, "Cache-Control": ETAG_CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {t.strip() for t in if_none_match.split(",")}
+        tags |= {t[2:] for t in tags if t.startswith("W/")}
+        if etag in tags or "*" in tags:
+            return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _cached_listing(
+        request: Request, cache_key: tuple,
+        folders: List[str], items: List[dict], prefix: str, next_token: Optional[str],
+) -> Response:
+    """Serialize a /list result, cache the body with its ETag, and return it."""
+    body = orjson.dumps({"folders": folders, "items": items, "prefix": prefix, "next_token": next_token})
+    etag = _body_etag(body)
+    cache_put(list_cache, cache_key, (body, etag))
+    return _etag_response(request, body, etag)
+
+
+# Zones and the default bucket are fixed at startup, so the /zones body (and its ETag) never changes.
+_ZONES_BODY = orjson.dumps({
+    "zones": [{"name": name, "endpoint": url} for name, url in S3_ZONES],
+    "bucket": DEFAULT_BUCKET,
+})
+_ZONES_ETAG = _body_etag(_ZONES_BODY)
+
+
 # ================== FastAPI app ==================
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await close_async_s3_clients()
+
+
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # tighten for production
@@ -26,127 +102,260 @@ app.add_middleware(
 )
 
 
-# ================== Routes ==================
-@app.get("/zones")
-def zones(user=Depends(verify_token)):
-    """Return configured zones and default bucket."""
-    return {
-        "zones": [{"name": name, "endpoint": url} for name, url in S3_ZONES],
-        "bucket": DEFAULT_BUCKET,
-    }
-
-
-@app.get("/list")
-def list_objects(
-        zone: str = Query(..., description="Zone name"),
-        prefix: str = Query(default="", description="Optional folder-like prefix, e.g. 'foo/'"),
-        bucket: Optional[str] = Query(default=None, description="If omitted, uses BUCKET from .env"),
-        user=Depends(verify_token),
-):
+# ================== Helpers ==================
+async def _fetch_zone_latest(
+        zone_name: str, zone_url: str, bkt: str, key: str,
+        limiter: asyncio.Semaphore,
+) -> Tuple[str, dict, Optional[dict]]:
     """
-    Folder-style listing for one zone using Delimiter='/'.
-    Returns:
-      {
-        "folders": ["sub1/","sub2/"],
-        "items": [{"key":"foo/bar.txt","last_modified":"...","size":123}, ...],
-        "prefix": "foo/"
-      }
+    Fetch the newest entry (version or delete marker) of `key` in one zone.
+    `limiter` caps how many of these calls a request has in flight.
+    Returns (zone_name, per-zone info, raw latest entry or None); an unreachable
+    zone yields an "error" info so it shows as Unknown instead of failing the request.
     """
-    bkt = bucket or DEFAULT_BUCKET
-    if not bkt:
-        raise HTTPException(status_code=400, detail="Missing 'bucket' and no BUCKET default set.")
-    if prefix and not prefix.endswith("/"):
-        prefix = prefix + "/"
-
-    zone_url = find_zone_url(zone)
-    s3 = get_s3_client(zone_url)
-
-    folders: List[str] = []
-    items: List[dict] = []
-    token: Optional[str] = None
-
     try:
-        while True:
-            kwargs = {"Bucket": bkt, "Delimiter": "/"}
-            if prefix:
-                kwargs["Prefix"] = prefix
-            if token:
-                kwargs["ContinuationToken"] = token
-
-            resp = s3.list_objects_v2(**kwargs)
-
-            for cp in (resp.get("CommonPrefixes") or []):
-                p = cp.get("Prefix")
-                if not p:
-                    continue
-                # show folder name relative to current prefix
-                name = p[len(prefix):] if prefix and p.startswith(prefix) else p
-                folders.append(name)
-
-            for obj in (resp.get("Contents") or []):
-                # skip the "directory marker" (the object that equals the prefix itself)
-                if prefix and obj.get("Key") == prefix:
-                    continue
-                items.append({
-                    "key": obj.get("Key"),
-                    "last_modified": format_datetime_iso(obj.get("LastModified")),
-                    "size": obj.get("Size"),
-                })
-
-            if resp.get("IsTruncated") and resp.get("NextContinuationToken"):
-                token = resp["NextContinuationToken"]
-            else:
-                break
+        s3 = await get_async_s3_client(zone_url)
+        # Listings are ordered by key, newest entry first within a key, and the exact
+        # key sorts before any sibling sharing it as a prefix, so the first couple of
+        # entries are enough to find its latest version or delete marker.
+        async with limiter:
+            resp = await s3.list_object_versions(Bucket=bkt, Prefix=key, MaxKeys=LATEST_LOOKUP_MAX_KEYS)
     except ClientError as e:
-        raise HTTPException(status_code=500, detail=e.response.get("Error", {}).get("Message", "S3 Error"))
+        return zone_name, {"zone": zone_name, "error": e.response.get("Error", {}).get("Message", "S3 Error"), "latest": None}, None
+    except BotoCoreError as e:
+        # connection failures, timeouts, ... from a zone that is down
+        return zone_name, {"zone": zone_name, "error": str(e), "latest": None}, None
 
-    return {"folders": folders, "items": items, "prefix": prefix}
+    # Manually tag entries from 'Versions' and 'DeleteMarkers' lists
+    # to distinguish them after merging.
+    obj_versions = resp.get("Versions") or []
+    del_markers = resp.get("DeleteMarkers") or []
+    for v in obj_versions: v['IsDeleteMarker'] = False
+    for d in del_markers: d['IsDeleteMarker'] = True
 
+    versions = obj_versions + del_markers
+    versions = [v for v in versions if v.get("Key") == key]
 
-@app.get("/consistency/check")
-def consistency_check(
-        key: str = Query(..., description="Object key to check"),
-        currentZone: str = Query(..., description="Zone currently selected by the UI"),
-        bucket: Optional[str] = Query(default=None),
-        user=Depends(verify_token),
-) -> dict:
+    latest = latest_entry_for_key(versions)
+    return zone_name, {"zone": zone_name, "latest": entry_to_brief(latest)}, latest
+
+
+async def _zone_lookups(
+        bkt: str, key: str, limiter: asyncio.Semaphore,
+) -> Tuple[Dict[str, dict], List[Tuple[str, dict]]]:
     """
-    Compare the latest version of `key` across all zones.
-    Returns per-zone latest/previous, whether globally consistent by ETag,
-    and a recommended zone to download from.
+    Look up the newest entry of `key` in every zone concurrently; wall time is bounded
+    by the slowest zone. Returns (per-zone info, (zone, raw latest entry) candidates).
+    Error-free results are briefly cached so repeat polls skip the zone round trips.
     """
-    bkt = bucket or DEFAULT_BUCKET
-    if not bkt:
-        raise HTTPException(status_code=400, detail="Missing 'bucket' and no BUCKET default set.")
+    cached = cache_get(consistency_cache, (bkt, key))
+    if cached is not None:
+        return cached
 
     per_zone: Dict[str, dict] = {}
     latest_candidates: List[Tuple[str, dict]] = []
+    results = await asyncio.gather(*(
+        _fetch_zone_latest(zone_name, zone_url, bkt, key, limiter) for zone_name, zone_url in S3_ZONES
+    ))
+    for zone_name, info, latest in results:
+        per_zone[zone_name] = info
+        if latest:
+            latest_candidates.append((zone_name, latest))
+
+    if not any("error" in info for info in per_zone.values()):
+        cache_put(consistency_cache, (bkt, key), (per_zone, latest_candidates))
+    return per_zone, latest_candidates
+
+
+def _paginate_folder(s3, bkt: str, prefix: str):
+    """Return a ListObjectsV2 page iterator for a folder-style listing of `prefix`."""
+    kwargs = {"Bucket": bkt, "Delimiter": "/"}
+    if prefix:
+        kwargs["Prefix"] = prefix
+    return s3.get_paginator("list_objects_v2").paginate(**kwargs, PaginationConfig={"PageSize": LIST_PAGE_SIZE})
 
-    for zone_name, zone_url in S3_ZONES:
-        s3 = get_s3_client(zone_url)
-        try:
-            resp = s3.list_object_versions(Bucket=bkt, Prefix=key)
 
-            # Manually tag entries from 'Versions' and 'DeleteMarkers' lists
-            # to distinguish them after merging.
-            obj_versions = resp.get("Versions") or []
-            del_markers = resp.get("DeleteMarkers") or []
-            for v in obj_versions: v['IsDeleteMarker'] = False
-            for d in del_markers: d['IsDeleteMarker'] = True
+def _list_page_entries(resp: dict, prefix: str) -> Tuple[List[str], List[dict]]:
+    """Extract (folders, items) from one ListObjectsV2 page, relative to `prefix`."""
+    folders: List[str] = []
+    items: List[dict] = []
+    for cp in (resp.get("CommonPrefixes") or []):
+        p = cp.get("Prefix")
+        if not p:
+            continue
+        # show folder name relative to current prefix
+        name = p[len(prefix):] if prefix and p.startswith(prefix) else p
+        folders.append(name)
+
+    for obj in (resp.get("Contents") or []):
+        # skip the "directory marker" (the object that equals the prefix itself)
+        if prefix and obj.get("Key") == prefix:
+            continue
+        items.append({
+            "key": obj.get("Key"),
+            # datetime is serialized to ISO-8601 by the JSON response
+            "last_modified": obj.get("LastModified"),
+            "size": obj.get("Size"),
+        })
+    return folders, items
 
-            versions = obj_versions + del_markers
-            versions = [v for v in versions if v.get("Key") == key]
 
-            latest = latest_entry_for_key(versions)
+def _list_folder_limited(
+        s3, bkt: str, prefix: str, limit: Optional[int], token: Optional[str],
+) -> Tuple[List[str], List[dict], Optional[str]]:
+    """
+    List up to `limit` folder entries (common prefixes and keys together), resuming from
+    the S3 continuation `token`; `limit=None` lists everything after `token`.
+    Returns (folders, items, S3 NextContinuationToken or None when the listing is done).
+    """
+    kwargs = {"Bucket": bkt, "Delimiter": "/"}
+    if prefix:
+        kwargs["Prefix"] = prefix
+    if token:
+        kwargs["ContinuationToken"] = token
 
-            per_zone[zone_name] = {
-                "zone": zone_name,
-                "latest": entry_to_brief(latest),
+    folders: List[str] = []
+    items: List[dict] = []
+    remaining = limit
+    while True:
+        # MaxKeys counts keys and common prefixes alike, so S3 never returns more than asked for.
+        kwargs["MaxKeys"] = min(remaining, LIST_PAGE_SIZE) if limit else LIST_PAGE_SIZE
+        resp = s3.list_objects_v2(**kwargs)
+        page_folders, page_items = _list_page_entries(resp, prefix)
+        folders.extend(page_folders)
+        items.extend(page_items)
+        next_token = resp.get("NextContinuationToken") if resp.get("IsTruncated") else None
+        if limit:
+            remaining -= len(resp.get("CommonPrefixes") or []) + len(resp.get("Contents") or [])
+        if not next_token or (limit and remaining <= 0):
+            return folders, items, next_token
+        kwargs["ContinuationToken"] = next_token
+
+
+def _list_key_range(
+        s3, bkt: str, prefix: str,
+        end: Optional[str],
+        start_after: Optional[str] = None,
+        continuation_token: Optional[str] = None,
+) -> Tuple[List[str], List[dict]]:
+    """
+    List folder entries (keys and common prefixes) that sort after `start_after`
+    (or resume from `continuation_token`) up to and including `end`; `end=None` means unbounded.
+    """
+    kwargs = {"Bucket": bkt, "Delimiter": "/", "MaxKeys": LIST_PAGE_SIZE}
+    if prefix:
+        kwargs["Prefix"] = prefix
+    if continuation_token:
+        kwargs["ContinuationToken"] = continuation_token
+    elif start_after:
+        kwargs["StartAfter"] = start_after
+
+    folders: List[str] = []
+    items: List[dict] = []
+    while True:
+        resp = s3.list_objects_v2(**kwargs)
+        done = not (resp.get("IsTruncated") and resp.get("NextContinuationToken"))
+        page = resp
+        if end is not None:
+            cps = resp.get("CommonPrefixes") or []
+            contents = resp.get("Contents") or []
+            page = {
+                "CommonPrefixes": [cp for cp in cps if (cp.get("Prefix") or "") <= end],
+                "Contents": [obj for obj in contents if (obj.get("Key") or "") <= end],
+            }
+            # anything past `end` belongs to the next range
+            if len(page["CommonPrefixes"]) < len(cps) or len(page["Contents"]) < len(contents):
+                done = True
+        page_folders, page_items = _list_page_entries(page, prefix)
+        folders.extend(page_folders)
+        items.extend(page_items)
+        if done:
+            return folders, items
+        kwargs.pop("StartAfter", None)
+        kwargs["ContinuationToken"] = resp["NextContinuationToken"]
+
+
+def _list_folder_parallel(s3, bkt: str, prefix: str) -> Tuple[List[str], List[dict]]:
+    """
+    Folder-style listing that splits large folders into key ranges listed concurrently.
+    The first page is fetched as usual; if it is truncated, the rest of the key space is
+    cut at LIST_SPLIT_BOUNDARIES into ranges (b_i, b_i+1] that are each paginated separately.
+    Results are merged in key order, matching the sequential listing.
+    """
+    kwargs = {"Bucket": bkt, "Delimiter": "/", "MaxKeys": LIST_PAGE_SIZE}
+    if prefix:
+        kwargs["Prefix"] = prefix
+    first = s3.list_objects_v2(**kwargs)
+    folders, items = _list_page_entries(first, prefix)
+    if not (first.get("IsTruncated") and first.get("NextContinuationToken")):
+        return folders, items
+
+    last_seen = max(
+        [cp.get("Prefix") or "" for cp in (first.get("CommonPrefixes") or [])]
+        + [obj.get("Key") or "" for obj in (first.get("Contents") or [])]
+    )
+    bounds = [prefix + c for c in LIST_SPLIT_BOUNDARIES if prefix + c > last_seen]
+
+    # The first range resumes from the first page's token; the others start after their lower bound.
+    ranges = [(None, bounds[0] if bounds else None, first["NextContinuationToken"])]
+    ranges += [(lo, hi, None) for lo, hi in zip(bounds, bounds[1:] + [None])]
+
+    with ThreadPoolExecutor(max_workers=min(LIST_PARALLEL_WORKERS, len(ranges))) as executor:
+        results = executor.map(lambda r: _list_key_range(s3, bkt, prefix, r[1], start_after=r[0], continuation_token=r[2]), ranges)
+        for range_folders, range_items in results:
+            folders.extend(range_folders)
+            items.extend(range_items)
+    return folders, items
+
+
+def _delete_chunk(zone_name: str, zone_url: str, bkt: str, keys: List[str]) -> Tuple[List[dict], List[dict]]:
+    """Delete up to DELETE_OBJECTS_CHUNK keys in one zone with a single DeleteObjects call."""
+    s3 = get_s3_client(zone_url)
+    try:
+        resp = s3.delete_objects(
+            Bucket=bkt,
+            Delete={"Objects": [{"Key": k} for k in keys], "Quiet": True},
+        )
+    except ClientError as e:
+        message = e.response.get("Error", {}).get("Message", "S3 Error")
+        return [], [{"zone": zone_name, "key": k, "error": message} for k in keys]
+
+    # Quiet mode only reports failures; everything else was deleted.
+    errors = [
+        {"zone": zone_name, "key": err.get("Key"), "error": err.get("Message") or err.get("Code") or "S3 Error"}
+        for err in (resp.get("Errors") or [])
+    ]
+    failed = {err["key"] for err in errors}
+    return [{"zone": zone_name, "key": k} for k in keys if k not in failed], errors
+
+
+def _summarize_consistency(
+        per_zone: Dict[str, dict],
+        latest_candidates: List[Tuple[str, dict]],
+        currentZone: str,
+) -> dict:
+    """
+    Classify each zone's latest entry against the global latest and build
+    the consistency result returned by the /consistency endpoints.
+    """
+    # Fast path for the fully replicated case: every zone answered with the same
+    # version (same ETag and timestamp), so all zones are Latest and consistent.
+    if per_zone and len(latest_candidates) == len(per_zone):
+        first = latest_candidates[0][1]
+        etag, ts = first.get("ETag"), first.get("LastModified")
+        if etag and ts and all(
+                not entry.get("IsDeleteMarker") and entry.get("ETag") == etag and entry.get("LastModified") == ts
+                for _, entry in latest_candidates
+        ):
+            return {
+                "consistent": True,
+                "per_zone": [
+                    {"zone": zname, "state": "Latest", "latest": info.get("latest")}
+                    for zname, info in per_zone.items()
+                ],
+                "recommended_download_zone": latest_candidates[0][0],
+                "current_zone_latest_is_delete_marker": False,
             }
-            if latest:
-                latest_candidates.append((zone_name, latest))
-        except ClientError as e:
-            per_zone[zone_name] = {"zone": zone_name, "error": e.response.get("Error", {}).get("Message", "S3 Error"), "latest": None}
 
     # Determine global latest and recommended download zone
     global_latest = find_best_version(latest_candidates)
@@ -162,9 +371,8 @@ def consistency_check(
     current_latest = current_zone_info.get("latest") if current_zone_info else None
     current_zone_latest_is_delete_marker = bool(current_latest and current_latest.get("type") == "DeleteMarker")
 
-    comparator_ts = None
-    if global_latest_entry and global_latest_entry.get("LastModified"):
-        comparator_ts = format_datetime_iso(global_latest_entry.get("LastModified"))
+    comparator_ts = global_latest_entry.get("LastModified") if global_latest_entry else None
+    raw_latest_by_zone = dict(latest_candidates)
 
     for zname, info in per_zone.items():
         latest = info.get("latest")
@@ -178,7 +386,8 @@ def consistency_check(
             state = "Latest" if global_latest_is_delete else "Missing"
         else:
             # Compare the zone's latest version timestamp to the global latest.
-            state = "Latest" if (comparator_ts and latest.get("last_modified") == comparator_ts) else "Outdated"
+            zone_ts = raw_latest_by_zone[zname].get("LastModified")
+            state = "Latest" if (comparator_ts and zone_ts == comparator_ts) else "Outdated"
 
         per_zone_list.append({
             "zone": zname,
@@ -204,6 +413,182 @@ def consistency_check(
     }
 
 
+# ================== Routes ==================
+@app.get("/zones")
+def zones(request: Request, user=Depends(verify_token)):
+    """Return configured zones and default bucket."""
+    return _etag_response(request, _ZONES_BODY, _ZONES_ETAG)
+
+
+@app.get("/list")
+def list_objects(
+        request: Request,
+        zone: str = Query(..., description="Zone name"),
+        prefix: str = Query(default="", description="Optional folder-like prefix, e.g. 'foo/'"),
+        bucket: Optional[str] = Query(default=None, description="If omitted, uses BUCKET from .env"),
+        limit: Optional[int] = Query(default=None, ge=1, description="Max folders + items to return; omit to list everything"),
+        token: Optional[str] = Query(default=None, description="'next_token' from a previous limited listing"),
+        parallel: bool = Query(default=False, description="List large folders as concurrent key ranges"),
+        user=Depends(verify_token),
+):
+    """
+    Folder-style listing for one zone using Delimiter='/'.
+    Returns:
+      {
+        "folders": ["sub1/","sub2/"],
+        "items": [{"key":"foo/bar.txt","last_modified":"...","size":123}, ...],
+        "prefix": "foo/",
+        "next_token": null
+      }
+    `next_token` is set when `limit` cut the listing short; pass it back as `token` to load more.
+    Folders and items count together against `limit`.
+    `parallel` only applies to full listings (no `limit`/`token`).
+    Responses carry an ETag; a matching If-None-Match gets an empty 304.
+    """
+    bkt = bucket or DEFAULT_BUCKET
+    if not bkt:
+        raise HTTPException(status_code=400, detail="Missing 'bucket' and no BUCKET default set.")
+    if prefix and not prefix.endswith("/"):
+        prefix = prefix + "/"
+
+    zone_url = find_zone_url(zone)
+    s3 = get_s3_client(zone_url)
+
+    cache_key = (zone, bkt, prefix, limit, token)
+    cached = cache_get(list_cache, cache_key)
+    if cached is not None:
+        body, etag = cached
+        return _etag_response(request, body, etag)
+
+    if parallel and not limit and not token:
+        try:
+            folders, items = _list_folder_parallel(s3, bkt, prefix)
+        except ClientError as e:
+            raise HTTPException(status_code=500, detail=e.response.get("Error", {}).get("Message", "S3 Error"))
+        return _cached_listing(request, cache_key, folders, items, prefix, None)
+
+    try:
+        folders, items, next_token = _list_folder_limited(s3, bkt, prefix, limit, token)
+    except ClientError as e:
+        if token and e.response.get("ResponseMetadata", {}).get("HTTPStatusCode") == 400:
+            # S3 answers 400 (InvalidArgument) for a continuation token it did not issue
+            raise HTTPException(status_code=400, detail="Invalid 'token'")
+        raise HTTPException(status_code=500, detail=e.response.get("Error", {}).get("Message", "S3 Error"))
+
+    return _cached_listing(request, cache_key, folders, items, prefix, next_token)
+
+
+@app.get("/list/stream")
+def list_objects_stream(
+        zone: str = Query(..., description="Zone name"),
+        prefix: str = Query(default="", description="Optional folder-like prefix, e.g. 'foo/'"),
+        bucket: Optional[str] = Query(default=None, description="If omitted, uses BUCKET from .env"),
+        user=Depends(verify_token),
+):
+    """
+    Streaming variant of /list for large folders, as NDJSON (one JSON object per line):
+      {"folder": "sub1/"}
+      {"item": {"key":"foo/bar.txt","last_modified":"...","size":123}}
+    Lines are sent as each S3 page arrives. An S3 failure after the first page
+    ends the stream with an {"error": "..."} line.
+    """
+    bkt = bucket or DEFAULT_BUCKET
+    if not bkt:
+        raise HTTPException(status_code=400, detail="Missing 'bucket' and no BUCKET default set.")
+    if prefix and not prefix.endswith("/"):
+        prefix = prefix + "/"
+
+    zone_url = find_zone_url(zone)
+    s3 = get_s3_client(zone_url)
+
+    pages = iter(_paginate_folder(s3, bkt, prefix))
+    try:
+        # Fetch the first page eagerly so S3 errors still map to an HTTP status.
+        first_page = next(pages, None)
+    except ClientError as e:
+        raise HTTPException(status_code=500, detail=e.response.get("Error", {}).get("Message", "S3 Error"))
+
+    def gen():
+        resp = first_page
+        while resp is not None:
+            folders, items = _list_page_entries(resp, prefix)
+            for name in folders:
+                yield orjson.dumps({"folder": name}) + b"\n"
+            for it in items:
+                yield orjson.dumps({"item": it}) + b"\n"
+            try:
+                resp = next(pages, None)
+            except ClientError as e:
+                yield orjson.dumps({"error": e.response.get("Error", {}).get("Message", "S3 Error")}) + b"\n"
+                return
+
+    return StreamingResponse(gen(), media_type="application/x-ndjson")
+
+
+@app.get("/consistency/check")
+async def consistency_check(
+        key: str = Query(..., description="Object key to check"),
+        currentZone: str = Query(..., description="Zone currently selected by the UI"),
+        bucket: Optional[str] = Query(default=None),
+        user=Depends(verify_token),
+) -> dict:
+    """
+    Compare the latest version of `key` across all zones.
+    Returns per-zone latest/previous, whether globally consistent by ETag,
+    and a recommended zone to download from.
+    """
+    bkt = bucket or DEFAULT_BUCKET
+    if not bkt:
+        raise HTTPException(status_code=400, detail="Missing 'bucket' and no BUCKET default set.")
+
+    per_zone, latest_candidates = await _zone_lookups(bkt, key, asyncio.Semaphore(ZONE_FANOUT_CONCURRENCY))
+    return _summarize_consistency(per_zone, latest_candidates, currentZone)
+
+
+@app.post("/consistency/batch")
+async def consistency_batch(
+        payload: dict = Body(..., example={"keys": ["foo/a.txt", "foo/b.txt"], "currentZone": "ceph-zone1",
+                                           "fields": ["type"]}),
+        bucket: Optional[str] = Query(default=None),
+        user=Depends(verify_token),
+) -> dict:
+    """
+    Batched variant of /consistency/check for up to BATCH_MAX_KEYS keys at once.
+    Returns {"results": {key: <consistency/check result>, ...}}.
+    Optional "fields" limits each zone's "latest" entry to those keys (e.g. ["type"]).
+    """
+    bkt = payload.get("bucket") or bucket or DEFAULT_BUCKET
+    if not bkt:
+        raise HTTPException(status_code=400, detail="Missing 'bucket' and no BUCKET default set.")
+
+    keys = payload.get("keys")
+    current_zone = payload.get("currentZone")
+    if not isinstance(keys, list) or not current_zone:
+        raise HTTPException(status_code=400, detail="Missing 'keys' list or 'currentZone'")
+    if len(keys) > BATCH_MAX_KEYS:
+        raise HTTPException(status_code=400, detail=f"At most {BATCH_MAX_KEYS} 'keys' per request")
+    keys = list(dict.fromkeys(k for k in keys if isinstance(k, str) and k))
+    fields = payload.get("fields")
+    if fields is not None and not isinstance(fields, list):
+        raise HTTPException(status_code=400, detail="'fields' must be a list")
+    if not keys:
+        return {"results": {}}
+
+    # Every (zone, key) lookup shares one limiter, so large folders don't flood the zones.
+    limiter = asyncio.Semaphore(BATCH_MAX_CONCURRENCY)
+    lookups = await asyncio.gather(*(_zone_lookups(bkt, k, limiter) for k in keys))
+
+    out: Dict[str, dict] = {}
+    for k, (per_zone, latest_candidates) in zip(keys, lookups):
+        result = _summarize_consistency(per_zone, latest_candidates, current_zone)
+        if fields is not None:
+            for pz in result["per_zone"]:
+                if pz["latest"]:
+                    pz["latest"] = {f: v for f, v in pz["latest"].items() if f in fields}
+        out[k] = result
+    return {"results": out}
+
+
 @app.post("/presign/download")
 def presign_download(
         payload: dict = Body(..., example={"zone": "ceph-zone1", "key": "file.txt", "version_id": None}),
@@ -223,15 +608,35 @@ def presign_download(
         raise HTTPException(status_code=400, detail="Missing 'zone' or 'key'")
 
     zone_url = find_zone_url(zone)
-    s3 = get_s3_client(zone_url)
-    try:
-        params = {"Bucket": bkt, "Key": key}
-        if version_id:
-            params["VersionId"] = version_id
-        url = s3.generate_presigned_url("get_object", Params=params, ExpiresIn=PRESIGN_TTL)
-        return {"url": url}
-    except ClientError as e:
-        raise HTTPException(status_code=500, detail=e.response.get("Error", {}).get("Message", "S3 Error"))
+    url = presign_v4_url(zone_url, bkt, key, PRESIGN_TTL, version_id=version_id)
+    return {"url": url}
+
+
+@app.post("/presign/download/batch")
+def presign_download_batch(
+        payload: dict = Body(..., example={"zone": "ceph-zone1", "keys": ["a.txt", "b.txt"]}),
+        bucket: Optional[str] = Query(default=None),
+        user=Depends(verify_token),
+):
+    """Return presigned GET URLs for up to BATCH_MAX_KEYS objects in one zone: {"urls": {key: url, ...}}."""
+    bkt = bucket or DEFAULT_BUCKET
+    if not bkt:
+        raise HTTPException(status_code=400, detail="Missing 'bucket' and no BUCKET default set.")
+
+    zone = payload.get("zone")
+    keys = payload.get("keys")
+    if not zone or not isinstance(keys, list):
+        raise HTTPException(status_code=400, detail="Missing 'zone' or 'keys' list")
+    if len(keys) > BATCH_MAX_KEYS:
+        raise HTTPException(status_code=400, detail=f"At most {BATCH_MAX_KEYS} 'keys' per request")
+
+    zone_url = find_zone_url(zone)
+    return {
+        "urls": {
+            k: presign_v4_url(zone_url, bkt, k, PRESIGN_TTL)
+            for k in keys if isinstance(k, str) and k
+        }
+    }
 
 
 @app.post("/presign/upload")
@@ -254,17 +659,11 @@ def presign_upload(
         raise HTTPException(status_code=400, detail="Missing 'zone' or 'key'")
 
     zone_url = find_zone_url(zone)
-    s3 = get_s3_client(zone_url)
-    try:
-        # Use a configurable, longer TTL for uploads to accommodate large files and slow connections.
-        url = s3.generate_presigned_url(
-            "put_object",
-            Params={"Bucket": bkt, "Key": key, "ContentType": content_type},
-            ExpiresIn=PRESIGN_UPLOAD_TTL,
-        )
-        return {"url": url}
-    except ClientError as e:
-        raise HTTPException(status_code=500, detail=e.response.get("Error", {}).get("Message", "S3 Error"))
+    # Use a configurable, longer TTL for uploads to accommodate large files and slow connections.
+    url = presign_v4_url(
+        zone_url, bkt, key, PRESIGN_UPLOAD_TTL, method="PUT", content_type=content_type,
+    )
+    return {"url": url}
 
 
 @app.delete("/objects/{zone}/{key:path}")
@@ -288,6 +687,71 @@ def delete_object(
     s3 = get_s3_client(zone_url)
     try:
         s3.delete_object(Bucket=bkt, Key=key)
+        invalidate(bkt, key)
         return {"status": "ok", "message": f"Object '{key}' deleted from zone '{zone}'."}
     except ClientError as e:
         raise HTTPException(status_code=500, detail=e.response.get("Error", {}).get("Message", "S3 Error"))
+
+
+@app.post("/objects/bulk-delete")
+def bulk_delete_objects(
+        payload: dict = Body(..., example={"zone": "ceph-zone1", "keys": ["a.txt", "b.txt"]}),
+        bucket: Optional[str] = Query(default=None),
+        user=Depends(verify_token),
+):
+    """
+    Delete many objects with S3 DeleteObjects (up to 1000 keys per call).
+    Accepts "zone" or a "zones" list; chunks for every zone are sent in parallel.
+    If versioning is enabled on the bucket, this will create delete markers.
+    Returns {"deleted": [{"zone","key"}, ...], "errors": [{"zone","key","error"}, ...]}.
+    """
+    bkt = payload.get("bucket") or bucket or DEFAULT_BUCKET
+    if not bkt:
+        raise HTTPException(status_code=400, detail="Missing 'bucket' and no BUCKET default set.")
+
+    zone_names = payload.get("zones") or ([payload["zone"]] if payload.get("zone") else [])
+    keys = payload.get("keys")
+    if not zone_names or not isinstance(zone_names, list) or not isinstance(keys, list):
+        raise HTTPException(status_code=400, detail="Missing 'zone' (or 'zones' list) or 'keys' list")
+    if not all(isinstance(name, str) for name in zone_names):
+        raise HTTPException(status_code=400, detail="Zone names must be strings")
+    keys = list(dict.fromkeys(k for k in keys if isinstance(k, str) and k))
+    zone_urls = [(name, find_zone_url(name)) for name in dict.fromkeys(zone_names)]
+
+    tasks = [
+        (zone_name, zone_url, keys[i:i + DELETE_OBJECTS_CHUNK])
+        for zone_name, zone_url in zone_urls
+        for i in range(0, len(keys), DELETE_OBJECTS_CHUNK)
+    ]
+    deleted: List[dict] = []
+    errors: List[dict] = []
+    if tasks:
+        with ThreadPoolExecutor(max_workers=min(BULK_DELETE_WORKERS, len(tasks))) as executor:
+            for chunk_deleted, chunk_errors in executor.map(lambda t: _delete_chunk(t[0], t[1], bkt, t[2]), tasks):
+                deleted.extend(chunk_deleted)
+                errors.extend(chunk_errors)
+        invalidate(bkt)
+
+    return {"deleted": deleted, "errors": errors}
+
+
+@app.post("/cache/invalidate")
+def cache_invalidate(
+        payload: dict = Body(default={}, example={"key": "foo/bar.txt"}),
+        bucket: Optional[str] = Query(default=None),
+        user=Depends(verify_token),
+):
+    """
+    Drop cached listings and consistency results for a bucket, e.g. after a presigned upload.
+    With 'key', only that object's consistency result is dropped (listings always are).
+    """
+    bkt = bucket or DEFAULT_BUCKET
+    if not bkt:
+        raise HTTPException(status_code=400, detail="Missing 'bucket' and no BUCKET default set.")
+
+    key = payload.get("key")
+    if key is not None and not isinstance(key, str):
+        raise HTTPException(status_code=400, detail="'key' must be a string")
+
+    invalidate(bkt, key)
+    return {"status": "ok"}
@@ -1,4 +1,8 @@
-from typing import Optional
+import hashlib
+import logging
+import threading
+import time
+from typing import Dict, Optional, Tuple
 
 import requests
 from fastapi import Depends, HTTPException
@@ -7,23 +11,117 @@ from jose import jwt
 
 from config import OIDC_ISSUER, OIDC_AUDIENCE
 
+# Child of uvicorn's logger so auth failures use its handler and INFO level.
+logger = logging.getLogger("uvicorn.error").getChild("auth")
+
 security = HTTPBearer()
+# Persistent session so JWKS refreshes reuse the TLS connection to the issuer.
+# Fetches are serialized by _jwks_lock, so sharing one session is safe.
+_http = requests.Session()
+
+JWKS_TTL_SECONDS = 3600
+# Start refreshing in the background once this fraction of the TTL has passed.
+JWKS_REFRESH_AHEAD = 0.9
+# Minimum spacing between refresh attempts (forced by unknown kids, or retries after a failure).
+JWKS_MIN_REFRESH_INTERVAL = 30
+
 JWKS_CACHE: Optional[dict] = None
+_jwks_fetched_at = 0.0
+_jwks_attempted_at = 0.0
+_jwks_refreshing = False
+_jwks_lock = threading.Lock()
 
+# Verified claims keyed by a hash of the raw token, reused until shortly before `exp`.
+TOKEN_CACHE_MAX_ENTRIES = 4096
+TOKEN_CACHE_EXP_MARGIN = 30
+_TOKEN_CACHE: Dict[bytes, Tuple[float, dict]] = {}
+_token_cache_lock = threading.RLock()
 
-def _get_jwks() -> dict:
-    global JWKS_CACHE
-    if JWKS_CACHE:
-        return JWKS_CACHE
+
+def _refresh_jwks_locked() -> None:
+    """
+    Fetch the JWKS from the issuer. Caller must hold _jwks_lock.
+    If the issuer is unreachable, keep serving the stale keys; only raise when nothing is cached.
+    """
+    global JWKS_CACHE, _jwks_fetched_at, _jwks_attempted_at
+    _jwks_attempted_at = time.monotonic()
     jwks_url = f"{OIDC_ISSUER}/protocol/openid-connect/certs"
-    resp = requests.get(jwks_url, timeout=5)
-    resp.raise_for_status()
-    JWKS_CACHE = resp.json()
-    return JWKS_CACHE
+    try:
+        resp = _http.get(jwks_url, timeout=5)
+        resp.raise_for_status()
+        jwks = resp.json()
+    except Exception as e:
+        if JWKS_CACHE is None:
+            raise
+        logger.warning("JWKS refresh failed, keeping cached keys: %s", e)
+        return
+    JWKS_CACHE = jwks
+    _jwks_fetched_at = _jwks_attempted_at
+
+
+def _background_refresh() -> None:
+    global _jwks_refreshing
+    try:
+        with _jwks_lock:
+            _refresh_jwks_locked()
+    finally:
+        _jwks_refreshing = False
+
+
+def _get_jwks(force_refresh: bool = False) -> dict:
+    """
+    Return the cached JWKS, refetching it when expired or on a forced refresh.
+    Attempts are spaced by JWKS_MIN_REFRESH_INTERVAL once keys are cached. Shortly
+    before expiry the keys are refreshed on a background thread so requests never
+    wait on the issuer.
+    """
+    global _jwks_refreshing
+    with _jwks_lock:
+        now = time.monotonic()
+        age = now - _jwks_fetched_at
+        can_retry = now - _jwks_attempted_at >= JWKS_MIN_REFRESH_INTERVAL
+        if JWKS_CACHE is None or (can_retry and (force_refresh or age >= JWKS_TTL_SECONDS)):
+            _refresh_jwks_locked()
+        elif can_retry and age >= JWKS_TTL_SECONDS * JWKS_REFRESH_AHEAD and not _jwks_refreshing:
+            _jwks_refreshing = True
+            threading.Thread(target=_background_refresh, daemon=True).start()
+        return JWKS_CACHE
+
+
+def _cached_claims(token_hash: bytes) -> Optional[dict]:
+    with _token_cache_lock:
+        hit = _TOKEN_CACHE.get(token_hash)
+        if not hit:
+            return None
+        exp, claims = hit
+        if exp > time.time() + TOKEN_CACHE_EXP_MARGIN:
+            return claims
+        del _TOKEN_CACHE[token_hash]
+        return None
+
+
+def _cache_claims(token_hash: bytes, claims: dict) -> None:
+    exp = claims.get("exp")
+    if not isinstance(exp, (int, float)):
+        return
+    with _token_cache_lock:
+        if len(_TOKEN_CACHE) >= TOKEN_CACHE_MAX_ENTRIES:
+            # sweep expired entries; drop everything if the cache is still full
+            now = time.time()
+            for h in [h for h, (e, _) in _TOKEN_CACHE.items() if e <= now + TOKEN_CACHE_EXP_MARGIN]:
+                del _TOKEN_CACHE[h]
+            if len(_TOKEN_CACHE) >= TOKEN_CACHE_MAX_ENTRIES:
+                _TOKEN_CACHE.clear()
+        _TOKEN_CACHE[token_hash] = (float(exp), claims)
 
 
 def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
     token = credentials.credentials
+    token_hash = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    claims = _cached_claims(token_hash)
+    if claims is not None:
+        # signature and audience were already verified on first use
+        return claims
     try:
         # find matching JWK by kid
         unverified_header = jwt.get_unverified_header(token)
@@ -35,15 +133,17 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
         jwk_key = next((k for k in jwks.get("keys", []) if k.get("kid") == kid), None)
         if not jwk_key:
             # key rotation fallback: refresh JWKS once
-            global JWKS_CACHE
-            JWKS_CACHE = None
-            jwks = _get_jwks()
+            jwks = _get_jwks(force_refresh=True)
             jwk_key = next((k for k in jwks.get("keys", []) if k.get("kid") == kid), None)
             if not jwk_key:
                 raise HTTPException(status_code=401, detail="No matching JWK for token kid")
 
-        return jwt.decode(token, jwk_key, algorithms=["RS256"], audience=OIDC_AUDIENCE)
-    except HTTPException:
+        claims = jwt.decode(token, jwk_key, algorithms=["RS256"], audience=OIDC_AUDIENCE)
+        _cache_claims(token_hash, claims)
+        return claims
+    except HTTPException as e:
+        logger.info("Auth failure: %s", e.detail)
         raise
     except Exception as e:
+        logger.info("Auth failure: token verification failed: %s", e)
         raise HTTPException(status_code=401, detail=f"Token verification failed: {e}")
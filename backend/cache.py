@@ -0,0 +1,41 @@
+import threading
+from typing import Any, Hashable, Optional
+
+from cachetools import TTLCache
+
+# Short-lived caches that absorb repeat UI polls (refresh buttons, tab switches).
+LIST_CACHE_TTL = 3
+CONSISTENCY_CACHE_TTL = 2
+
+# (zone, bucket, prefix, limit, token) -> (serialized body, etag)
+list_cache: TTLCache = TTLCache(maxsize=512, ttl=LIST_CACHE_TTL)
+# (bucket, key) -> (per-zone info, latest candidates)
+consistency_cache: TTLCache = TTLCache(maxsize=512, ttl=CONSISTENCY_CACHE_TTL)
+
+# TTLCache is not thread-safe; sync handlers run on the threadpool, async ones on the loop.
+_lock = threading.Lock()
+
+
+def cache_get(cache: TTLCache, key: Hashable) -> Optional[Any]:
+    with _lock:
+        return cache.get(key)
+
+
+def cache_put(cache: TTLCache, key: Hashable, value: Any) -> None:
+    with _lock:
+        cache[key] = value
+
+
+def invalidate(bucket: str, key: Optional[str] = None) -> None:
+    """
+    Drop cached listings for `bucket` (in every zone, since changes replicate) and
+    cached consistency results for `key`, or for the whole bucket when `key` is omitted.
+    """
+    with _lock:
+        for k in [k for k in list_cache.keys() if k[1] == bucket]:
+            list_cache.pop(k, None)
+        if key is not None:
+            consistency_cache.pop((bucket, key), None)
+        else:
+            for k in [k for k in consistency_cache.keys() if k[0] == bucket]:
+                consistency_cache.pop(k, None)
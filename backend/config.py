@@ -1,5 +1,5 @@
 import os
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 from urllib.parse import urlparse
 
 # --- Load .env (optional) ---
@@ -56,6 +56,7 @@ def _parse_zones(raw: str) -> List[Tuple[str, str]]:
 
 
 S3_ZONES: List[Tuple[str, str]] = _parse_zones(raw_zones)
+S3_ZONES_MAP: Dict[str, str] = dict(S3_ZONES)
 
 if not OIDC_ISSUER:
     raise RuntimeError("Missing OIDC issuer. Set OIDC_ISSUER (or KEYCLOAK_URL) in .env")
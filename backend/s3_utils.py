@@ -1,21 +1,164 @@
-from datetime import datetime
-from typing import List, Tuple, Optional
+import asyncio
+import hashlib
+import heapq
+import hmac
+from contextlib import AsyncExitStack
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Dict, List, Tuple, Optional
+from urllib.parse import quote, urlsplit
 
 import boto3
+from aiobotocore.config import AioConfig
+from aiobotocore.session import get_session
+from botocore.config import Config
 from fastapi import HTTPException
 
-from config import RGW_ACCESS_KEY, RGW_SECRET_KEY, S3_ZONES
+from config import RGW_ACCESS_KEY, RGW_SECRET_KEY, S3_ZONES_MAP
 
+# Shared by every cached client: a pool large enough for concurrent zone
+# fan-out, and keep-alive so connections survive between requests.
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+    tcp_keepalive=True,
+)
 
+
+@lru_cache(maxsize=32)
 def get_s3_client(zone_url: str):
+    """
+    Return the S3 client for a zone, building it only once per endpoint.
+    boto3 clients are thread-safe, so the same instance is shared across requests.
+    """
     return boto3.client(
         "s3",
         endpoint_url=zone_url,
         aws_access_key_id=RGW_ACCESS_KEY,
         aws_secret_access_key=RGW_SECRET_KEY,
+        config=S3_CLIENT_CONFIG,
     )
 
 
+# Async clients for endpoints that fan out over zones on the event loop.
+ASYNC_S3_CLIENT_CONFIG = AioConfig(
+    max_pool_connections=50,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+)
+_async_session = get_session()
+_async_clients: Dict[str, object] = {}
+_async_clients_stack = AsyncExitStack()
+_async_clients_lock: Optional[asyncio.Lock] = None
+
+
+async def get_async_s3_client(zone_url: str):
+    """
+    Return the aiobotocore S3 client for a zone, creating it on first use.
+    Clients stay open (keeping their connection pools) until close_async_s3_clients().
+    """
+    global _async_clients_lock
+    client = _async_clients.get(zone_url)
+    if client is not None:
+        return client
+    if _async_clients_lock is None:
+        _async_clients_lock = asyncio.Lock()
+    async with _async_clients_lock:
+        client = _async_clients.get(zone_url)
+        if client is None:
+            client = await _async_clients_stack.enter_async_context(_async_session.create_client(
+                "s3",
+                endpoint_url=zone_url,
+                aws_access_key_id=RGW_ACCESS_KEY,
+                aws_secret_access_key=RGW_SECRET_KEY,
+                config=ASYNC_S3_CLIENT_CONFIG,
+            ))
+            _async_clients[zone_url] = client
+    return client
+
+
+async def close_async_s3_clients() -> None:
+    """Close every cached async client; called on application shutdown."""
+    await _async_clients_stack.aclose()
+    _async_clients.clear()
+
+
+# -------- Presigned URLs --------
+def _hmac_sha256(key: bytes, msg: str) -> bytes:
+    return hmac.new(key, msg.encode("utf-8"), hashlib.sha256).digest()
+
+
+@lru_cache(maxsize=16)
+def _sigv4_signing_key(secret_key: str, date_stamp: str, region: str, service: str) -> bytes:
+    """Derive the SigV4 signing key; it only changes per day, so derivations are cached."""
+    k_date = _hmac_sha256(("AWS4" + secret_key).encode("utf-8"), date_stamp)
+    k_region = _hmac_sha256(k_date, region)
+    k_service = _hmac_sha256(k_region, service)
+    return _hmac_sha256(k_service, "aws4_request")
+
+
+def presign_v4_url(
+        zone_url: str,
+        bucket: str,
+        key: str,
+        expires: int,
+        method: str = "GET",
+        version_id: Optional[str] = None,
+        content_type: Optional[str] = None,
+) -> str:
+    """
+    Build a SigV4 query-signed, path-style URL for an object, without a botocore request.
+    Matches what the zone's boto3 client generates: same region and addressing style,
+    UNSIGNED-PAYLOAD, and Content-Type signed for uploads so the PUT must send it.
+    """
+    region = get_s3_client(zone_url).meta.region_name or ""
+    now = datetime.now(timezone.utc)
+    amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+    date_stamp = amz_date[:8]
+
+    parts = urlsplit(zone_url)
+    host = parts.netloc.lower()
+    if (parts.scheme == "http" and host.endswith(":80")) or (parts.scheme == "https" and host.endswith(":443")):
+        host = host.rsplit(":", 1)[0]
+    path = f"{parts.path.rstrip('/')}/{quote(bucket, safe='~')}/{quote(key, safe='/~')}"
+
+    headers = {"host": host}
+    if content_type:
+        headers["content-type"] = content_type
+    signed_headers = ";".join(sorted(headers))
+
+    scope = f"{date_stamp}/{region}/s3/aws4_request"
+    params = {
+        "X-Amz-Algorithm": "AWS4-HMAC-SHA256",
+        "X-Amz-Credential": f"{RGW_ACCESS_KEY}/{scope}",
+        "X-Amz-Date": amz_date,
+        "X-Amz-Expires": str(expires),
+        "X-Amz-SignedHeaders": signed_headers,
+    }
+    if version_id:
+        params["versionId"] = version_id
+    query = "&".join(
+        f"{quote(k, safe='-_.~')}={quote(v, safe='-_.~')}" for k, v in sorted(params.items())
+    )
+
+    canonical_request = "\n".join([
+        method,
+        path,
+        query,
+        "".join(f"{name}:{' '.join(headers[name].split())}\n" for name in sorted(headers)),
+        signed_headers,
+        "UNSIGNED-PAYLOAD",
+    ])
+    string_to_sign = "\n".join([
+        "AWS4-HMAC-SHA256",
+        amz_date,
+        scope,
+        hashlib.sha256(canonical_request.encode("utf-8")).hexdigest(),
+    ])
+    signing_key = _sigv4_signing_key(RGW_SECRET_KEY, date_stamp, region, "s3")
+    signature = hmac.new(signing_key, string_to_sign.encode("utf-8"), hashlib.sha256).hexdigest()
+    return f"{parts.scheme}://{parts.netloc}{path}?{query}&X-Amz-Signature={signature}"
+
+
 def format_datetime_iso(dt: Optional[datetime]) -> Optional[str]:
     """Formats a datetime object to an ISO string without microseconds."""
     if not dt:
@@ -24,34 +167,46 @@ def format_datetime_iso(dt: Optional[datetime]) -> Optional[str]:
 
 
 def find_zone_url(name: str) -> str:
-    for n, u in S3_ZONES:
-        if n == name:
-            return u
-    raise HTTPException(status_code=404, detail=f"Zone '{name}' not found")
+    url = S3_ZONES_MAP.get(name)
+    if url is None:
+        raise HTTPException(status_code=404, detail=f"Zone '{name}' not found")
+    return url
 
 
 # -------- Version helpers --------
 def latest_entry_for_key(versions: List[dict]) -> Optional[dict]:
     if not versions:
         return None
-    return sorted(versions, key=lambda v: v.get("LastModified"), reverse=True)[0]
+    return max(versions, key=lambda v: v.get("LastModified"))
 
 
 def previous_entry_for_key(versions: List[dict], latest: Optional[dict]) -> Optional[dict]:
     if not versions or not latest:
         return None
-    ordered = sorted(versions, key=lambda v: v.get("LastModified"), reverse=True)
-    return ordered[1] if len(ordered) > 1 else None
+    top2 = heapq.nlargest(2, versions, key=lambda v: v.get("LastModified"))
+    return top2[1] if len(top2) > 1 else None
 
 
+# inline-hot: runs for every zone's latest entry on each consistency lookup; keep it free of per-call work.
 def entry_to_brief(entry: Optional[dict]) -> Optional[dict]:
     if not entry:
         return None
-    typ = "DeleteMarker" if entry.get("IsDeleteMarker") else "Version"
+    if entry.get("IsDeleteMarker"):
+        # delete markers have no content, so etag/size would always be null
+        return {
+            "type": "DeleteMarker",
+            "version_id": entry.get("VersionId"),
+            "last_modified": format_datetime_iso(entry.get("LastModified")),
+            "is_latest": bool(entry.get("IsLatest")),
+        }
+    # ETags arrive quoted; drop the surrounding quotes by slicing rather than strip()
+    etag = entry.get("ETag")
+    if etag and len(etag) >= 2 and etag[0] == '"' and etag[-1] == '"':
+        etag = etag[1:-1]
     return {
-        "type": typ,
+        "type": "Version",
         "version_id": entry.get("VersionId"),
-        "etag": entry.get("ETag", "").strip('"') if entry.get("ETag") else None,
+        "etag": etag or None,
         "last_modified": format_datetime_iso(entry.get("LastModified")),
         "size": entry.get("Size"),
         "is_latest": bool(entry.get("IsLatest")),
@@ -63,8 +218,8 @@ def find_best_version(
         ignore_delete_markers: bool = False
 ) -> Optional[Tuple[str, dict]]:
     """Find the best version entry from a list of (zone, entry) tuples based on LastModified."""
-    valid_candidates = [
+    valid_candidates = (
         (zone, entry) for zone, entry in candidates
         if not (ignore_delete_markers and entry.get("IsDeleteMarker")) and entry.get("LastModified")
-    ]
-    return max(valid_candidates, key=lambda item: item[1]["LastModified"]) if valid_candidates else None
+    )
+    return max(valid_candidates, key=lambda item: item[1]["LastModified"], default=None)
@@ -122,28 +122,54 @@ async function loadZones() {
 const statusCache = new Map(); // key -> {state, isDeleteMarker, fetchedAt}
 const STATUS_TTL_MS = 30_000;
 const CONCURRENCY = 5;
+const STATUS_BATCH_SIZE = 100; // keys per /consistency/batch request
 
-async function fetchStatusForKey(key) {
-    if (!HAS_CONSISTENCY_API) return {state: 'Unknown', isDeleteMarker: false, fetchedAt: Date.now()};
+/**
+ * Summarizes a /consistency result for the given zone into a cache entry.
+ * @param {object} data The consistency result.
+ * @param {string} zoneName The zone whose state is displayed.
+ * @param {number} fetchedAt Timestamp of the fetch.
+ */
+function toStatusEntry(data, zoneName, fetchedAt) {
+    let state = 'Unknown';
+    let isDeleteMarker = false;
+    for (const z of data.per_zone || []) {
+        if (z.zone === zoneName) {
+            state = z.state || 'Unknown';
+            isDeleteMarker = !!(z.latest && z.latest.type === 'DeleteMarker');
+            break;
+        }
+    }
+    return {state, isDeleteMarker, fetchedAt, check: data};
+}
+
+/**
+ * Fetches statuses for many keys with a single batch request, skipping keys
+ * that are still fresh in the cache.
+ * @param {string[]} keys
+ * @returns {Promise<Map<string, object>>} key -> status cache entry
+ */
+async function fetchStatusForKeys(keys) {
+    const out = new Map();
+    if (!HAS_CONSISTENCY_API) return out;
     const now = Date.now();
-    const cached = statusCache.get(key);
-    if (cached && (now - cached.fetchedAt) < STATUS_TTL_MS) return cached;
+    const missing = [];
+    for (const key of keys) {
+        const cached = statusCache.get(key);
+        if (cached && (now - cached.fetchedAt) < STATUS_TTL_MS) out.set(key, cached);
+        else missing.push(key);
+    }
+    if (!missing.length) return out;
 
     const zoneName = zoneSel.value;
     try {
-        const data = await api.checkConsistency(key, zoneName);
-        let state = 'Unknown';
-        let isDeleteMarker = false;
-        for (const z of data.per_zone || []) {
-            if (z.zone === zoneName) {
-                state = z.state || 'Unknown';
-                isDeleteMarker = !!(z.latest && z.latest.type === 'DeleteMarker');
-                break;
-            }
+        const {results = {}} = await api.checkConsistencyBatch(missing, zoneName);
+        for (const [key, data] of Object.entries(results)) {
+            const obj = toStatusEntry(data, zoneName, now);
+            statusCache.set(key, obj);
+            out.set(key, obj);
         }
-        const obj = {state, isDeleteMarker, fetchedAt: now, check: data};
-        statusCache.set(key, obj);
-        return obj;
+        return out;
     } catch (e) {
         if (String(e).includes('404')) {
             HAS_CONSISTENCY_API = false;
@@ -195,12 +221,76 @@ function navigateTo(prefix) {
     listObjects();
 }
 
+/** Builds the "up one level" row. */
+function buildGoUpRow() {
+    const row = objectRowTemplate.content.cloneNode(true);
+    const link = row.querySelector('a.link');
+    link.dataset.action = 'go-up';
+    row.querySelector('.icon').innerHTML = ICON_FOLDER;
+    row.querySelector('.link-text').textContent = '..';
+    row.querySelector('.modified').textContent = '';
+    row.querySelector('.size').textContent = '';
+    row.querySelector('.badge').remove(); // No badge for "up" link
+    return row;
+}
+
+/** Builds a folder row for a folder name relative to the current prefix. */
+function buildFolderRow(name) {
+    const displayName = name.replace(/\/$/, '');
+    const row = objectRowTemplate.content.cloneNode(true);
+    const link = row.querySelector('a.link');
+    link.dataset.action = 'open-folder';
+    link.dataset.folderName = name;
+    row.querySelector('.icon').innerHTML = ICON_FOLDER;
+    row.querySelector('.link-text').textContent = displayName;
+    row.querySelector('.modified').textContent = 'Folder';
+    row.querySelector('.size').textContent = '—';
+    row.querySelector('.badge').remove(); // No badge for folders
+    return row;
+}
+
+/** Builds a file row; the badge is kept only when statuses are wanted. */
+function buildFileRow(it, prefix, wantStatus) {
+    const row = objectRowTemplate.content.cloneNode(true);
+    const displayName = (prefix && it.key.startsWith(prefix)) ? it.key.substring(prefix.length) : it.key;
+    const link = row.querySelector('a.link');
+    link.dataset.action = 'download-object';
+    link.dataset.key = it.key;
+    row.querySelector('.icon').innerHTML = ICON_FILE;
+    row.querySelector('.link-text').textContent = displayName;
+    row.querySelector('.modified').textContent = formatDate(it.last_modified);
+    row.querySelector('.size').textContent = formatSize(it.size);
+
+    const badge = row.querySelector('.badge'); // Keep this reference
+    if (wantStatus) {
+        badge.dataset.key = it.key; // Add key to badge for easy selection later
+    } else {
+        badge.remove();
+    }
+
+    // Add delete button for file objects
+    const actions = row.querySelector('.actions');
+    if (actions) {
+        const deleteBtn = document.createElement('button');
+        deleteBtn.className = 'btn-icon';
+        deleteBtn.title = 'Delete object';
+        deleteBtn.dataset.action = 'delete-object';
+        deleteBtn.dataset.key = it.key;
+        deleteBtn.innerHTML = ICON_DELETE;
+        actions.appendChild(deleteBtn);
+    }
+    return row;
+}
+
+let listGeneration = 0; // bumped on every listing so stale streams stop rendering
+
 /**
- * Fetches object list from the API and triggers rendering and status checks.
- * Handles loading and error states for the file list display.
+ * Streams the object list from the API, rendering rows as they arrive,
+ * then triggers status checks. Handles loading and error states for the file list display.
  */
 async function listObjects() { // Fetches and orchestrates rendering
     if (!user) return;
+    const generation = ++listGeneration;
 
     // Show loading state immediately and handle errors centrally
     fileList.innerHTML = '<div class="small" style="padding: 12px 16px;">Loading...</div>';
@@ -210,97 +300,61 @@ async function listObjects() { // Fetches and orchestrates rendering
         const prefix = currentPrefix;
         localStorage.setItem('zoneName', zone);
 
-        const data = await api.listObjects(zone, prefix);
-        const folders = data.folders || [];
-        const items = data.items || [];
-
-        buildBreadcrumb(prefix);
-        fileList.innerHTML = ''; // Clear loading state
-        const fragment = document.createDocumentFragment();
-
-        // "Up one level" link
-        if (prefix) {
-            const row = objectRowTemplate.content.cloneNode(true);
-            const link = row.querySelector('a.link');
-            link.dataset.action = 'go-up';
-            row.querySelector('.icon').innerHTML = ICON_FOLDER;
-            row.querySelector('.link-text').textContent = '..';
-            row.querySelector('.modified').textContent = '';
-            row.querySelector('.size').textContent = '';
-            row.querySelector('.badge').remove(); // No badge for "up" link
-            fragment.appendChild(row);
-        }
-
-        // Folder rows
-        folders.forEach(name => {
-            const displayName = name.replace(/\/$/, '');
-            const row = objectRowTemplate.content.cloneNode(true);
-            const link = row.querySelector('a.link');
-            link.dataset.action = 'open-folder';
-            link.dataset.folderName = name;
-            row.querySelector('.icon').innerHTML = ICON_FOLDER;
-            row.querySelector('.link-text').textContent = displayName;
-            row.querySelector('.modified').textContent = 'Folder';
-            row.querySelector('.size').textContent = '—';
-            row.querySelector('.badge').remove(); // No badge for folders
-            fragment.appendChild(row);
-        });
-
-        // File rows
-        const spansByKey = new Map(); // key -> badge element (only when enabled)
+        const items = [];
         const wantStatus = showStatus.checked;
-        items.forEach(it => {
-            const row = objectRowTemplate.content.cloneNode(true);
-            const displayName = (prefix && it.key.startsWith(prefix)) ? it.key.substring(prefix.length) : it.key;
-            const link = row.querySelector('a.link');
-            link.dataset.action = 'download-object';
-            link.dataset.key = it.key;
-            row.querySelector('.icon').innerHTML = ICON_FILE;
-            row.querySelector('.link-text').textContent = displayName;
-            row.querySelector('.modified').textContent = formatDate(it.last_modified);
-            row.querySelector('.size').textContent = formatSize(it.size);
-
-            const badge = row.querySelector('.badge'); // Keep this reference
-            if (wantStatus) {
-                badge.dataset.key = it.key; // Add key to badge for easy selection later
-            } else {
-                badge.remove();
-            }
-
-            // Add delete button for file objects
-            const actions = row.querySelector('.actions');
-            if (actions) {
-                const deleteBtn = document.createElement('button');
-                deleteBtn.className = 'btn-icon';
-                deleteBtn.title = 'Delete object';
-                deleteBtn.dataset.action = 'delete-object';
-                deleteBtn.dataset.key = it.key;
-                deleteBtn.innerHTML = ICON_DELETE;
-                actions.appendChild(deleteBtn);
+        // Folders are inserted before this marker and files appended after it,
+        // so folders stay on top even when they arrive in later pages.
+        const filesMarker = document.createComment('files');
+        let started = false;
+        const startRendering = () => {
+            if (started) return;
+            started = true;
+            buildBreadcrumb(prefix);
+            fileList.innerHTML = ''; // Clear loading state
+            if (prefix) fileList.appendChild(buildGoUpRow());
+            fileList.appendChild(filesMarker);
+        };
+
+        await api.streamObjects(zone, prefix, (entry) => {
+            if (generation !== listGeneration) return false; // a newer listing took over
+            if (entry.error) throw new Error(entry.error);
+            startRendering();
+            if (typeof entry.folder === 'string') {
+                fileList.insertBefore(buildFolderRow(entry.folder), filesMarker);
+            } else if (entry.item) {
+                items.push(entry.item);
+                fileList.appendChild(buildFileRow(entry.item, prefix, wantStatus));
             }
-
-            fragment.appendChild(row);
         });
+        if (generation !== listGeneration) return;
 
-        if (fragment.childElementCount === 0) {
+        startRendering();
+        if (fileList.childElementCount === 0) {
             fileList.innerHTML = '<div class="small" style="padding: 12px 16px;">No objects.</div>';
-        } else {
-            fileList.appendChild(fragment);
         }
 
         // Replication status (files only when enabled)
         if (wantStatus && items.length && HAS_CONSISTENCY_API) {
-            const statusTasks = items.map(it => async () => {
+            // One batch request per chunk instead of one request per row.
+            const keys = items.map(it => it.key);
+            const chunks = [];
+            for (let i = 0; i < keys.length; i += STATUS_BATCH_SIZE) {
+                chunks.push(keys.slice(i, i + STATUS_BATCH_SIZE));
+            }
+            const statusTasks = chunks.map(chunk => async () => {
                 try {
-                    const {state, isDeleteMarker} = await fetchStatusForKey(it.key);
-                    const span = fileList.querySelector(`.badge[data-key="${it.key}"]`);
-                    updateBadge(span, state, isDeleteMarker);
-                } catch { /* Ignore individual errors */
+                    const statuses = await fetchStatusForKeys(chunk);
+                    for (const [key, {state, isDeleteMarker}] of statuses) {
+                        const span = fileList.querySelector(`.badge[data-key="${CSS.escape(key)}"]`);
+                        updateBadge(span, state, isDeleteMarker);
+                    }
+                } catch { /* Ignore individual batch errors */
                 }
             });
             await promisePool(statusTasks, CONCURRENCY);
         }
     } catch (e) {
+        if (generation !== listGeneration) return; // a newer listing owns the view
         console.error('Failed to list objects:', e);
         fileList.innerHTML = `<div class="small" style="padding: 12px 16px; color: red;">Failed to load objects: ${e.message}</div>`;
     }
@@ -2,12 +2,12 @@ import {getAuthHeaders, getUser} from './auth.js';
 import {API_BASE} from './config.js';
 
 /**
- * A generic API fetch helper.
+ * Sends an authenticated request and throws on non-2xx responses.
  * @param {string} path - The API endpoint path.
  * @param {object} options - Fetch options.
- * @returns {Promise<any>} The JSON response.
+ * @returns {Promise<Response>} The raw response.
  */
-async function _fetchApi(path, options = {}) {
+async function _request(path, options = {}) {
     if (!getUser()) {
         throw new Error('Please login first.');
     }
@@ -23,6 +23,17 @@ async function _fetchApi(path, options = {}) {
         const t = await res.text().catch(() => res.statusText);
         throw new Error(`${res.status} ${t}`);
     }
+    return res;
+}
+
+/**
+ * A generic API fetch helper.
+ * @param {string} path - The API endpoint path.
+ * @param {object} options - Fetch options.
+ * @returns {Promise<any>} The JSON response.
+ */
+async function _fetchApi(path, options = {}) {
+    const res = await _request(path, options);
     return res.json();
 }
 
@@ -35,12 +46,54 @@ export function listObjects(zone, prefix) {
     return _fetchApi(`/list?zone=${encodeURIComponent(zone)}&prefix=${encodeURIComponent(prefix)}`, {cache: 'no-cache'});
 }
 
+/**
+ * Streams a folder listing as NDJSON, calling `onEntry` for each parsed line
+ * ({folder}, {item} or {error}) as soon as it arrives.
+ * Returning `false` from `onEntry` stops reading the stream.
+ * @param {string} zone
+ * @param {string} prefix
+ * @param {(entry: object) => (boolean|void)} onEntry
+ * @returns {Promise<void>}
+ */
+export async function streamObjects(zone, prefix, onEntry) {
+    const res = await _request(`/list/stream?zone=${encodeURIComponent(zone)}&prefix=${encodeURIComponent(prefix)}`, {cache: 'no-cache'});
+    const reader = res.body.getReader();
+    const decoder = new TextDecoder();
+    let buf = '';
+    try {
+        while (true) {
+            const {value, done} = await reader.read();
+            buf += done ? decoder.decode() : decoder.decode(value, {stream: true});
+            let nl;
+            while ((nl = buf.indexOf('\n')) >= 0) {
+                const line = buf.slice(0, nl);
+                buf = buf.slice(nl + 1);
+                if (line && onEntry(JSON.parse(line)) === false) return;
+            }
+            if (done) break;
+        }
+        if (buf.trim()) onEntry(JSON.parse(buf));
+    } finally {
+        reader.cancel().catch(() => {});
+    }
+}
+
 export function checkConsistency(key, currentZone) {
     // This endpoint is for checking the *current* state, so we should never use the browser cache.
     // The application-level cache in app.js will prevent excessive requests.
     return _fetchApi(`/consistency/check?key=${encodeURIComponent(key)}&currentZone=${encodeURIComponent(currentZone)}`, {cache: 'no-cache'});
 }
 
+export function checkConsistencyBatch(keys, currentZone) {
+    // Same freshness rules as checkConsistency, but one round trip for many keys.
+    return _fetchApi('/consistency/batch', {
+        method: 'POST',
+        // Badges only look at the latest entry's type, so skip the other brief fields.
+        body: JSON.stringify({keys, currentZone, fields: ['type']}),
+        cache: 'no-cache',
+    });
+}
+
 export async function uploadFile(zone, key, file) {
     const presign = await _fetchApi('/presign/upload', {
         method: 'POST',
@@ -53,6 +106,17 @@ export async function uploadFile(zone, key, file) {
         headers: {'Content-Type': file.type || 'application/octet-stream'}
     });
     if (!resp.ok) throw new Error(await resp.text());
+
+    // The upload bypassed the backend, so tell it to drop its short-lived listing/status caches.
+    // Best effort: the upload already succeeded, and the caches expire on their own within seconds.
+    try {
+        await _fetchApi('/cache/invalidate', {
+            method: 'POST',
+            body: JSON.stringify({key}),
+        });
+    } catch (e) {
+        console.error('Failed to invalidate caches after upload:', e);
+    }
 }
 
 export async function getDownloadUrl(zone, key, version_id = null) {